@@ -1,5 +1,4 @@
 import asyncio
-import re
 import ssl
 from typing import Optional
 
@@ -81,11 +80,7 @@ class AioHttpDownloadHandler(BaseDownloadHandler):
                 async with session.request(request.method, request.url, **kwargs) as response:
                     content: bytes = await response.read()
 
-        r_cookies = response.cookies.output() or None
-        if r_cookies:
-            r_cookies = {
-                cookie[0]: cookie[1] for cookie in re.findall(r'Set-Cookie: (.*?)=(.*?); Domain', r_cookies, re.S)
-            }
+        r_cookies = {key: morsel.value for key, morsel in response.cookies.items()} or None
 
         return HtmlResponse(
             str(response.url),
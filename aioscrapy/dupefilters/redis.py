@@ -56,10 +56,22 @@ class HashMap(object):
         :param value: Value
         :return: Hash Value
         """
+        return self.hash_codes([ord(c) for c in value])
+
+    def hash_codes(self, codes):
+        """
+        Hash Algorithm on the character codes of a value
+        :param codes: ord() of each character of the value
+        :return: Hash Value
+        """
+        # ret = ret * (seed + 1) + ord(c) only ever lands in ``ret & (m - 1)``, and m is
+        # a power of two, so masking every step keeps ret a small int with the same result
+        mask = self.m - 1
+        factor = self.seed + 1
         ret = 0
-        for i in range(len(value)):
-            ret += self.seed * ret + ord(value[i])
-        return (self.m - 1) & ret
+        for c in codes:
+            ret = (ret * factor + c) & mask
+        return ret
 
 
 class BloomFilter(object):
@@ -78,14 +90,22 @@ class BloomFilter(object):
         self.key = key
         self.maps = [HashMap(self.m, seed) for seed in self.seeds]
 
+    def _offsets(self, value):
+        """
+        Bit offsets of value for all hash functions, decoding value only once
+        :param value: Value
+        :return: list of offsets
+        """
+        codes = [ord(c) for c in value]
+        return [f.hash_codes(codes) for f in self.maps]
+
     async def exists(self, value):
         if not value:
             return False
-        async with self.server.pipeline(transaction=True) as pipe:
-            for f in self.maps:
-                offset = f.hash(value)
-                pipe.getbit(self.key, offset)
-            result = await pipe.execute()
+        bf = self.server.bitfield(self.key)
+        for offset in self._offsets(value):
+            bf.get('u1', offset)
+        result = await bf.execute()
         return all(result)
 
     async def insert(self, value):
@@ -94,11 +114,10 @@ class BloomFilter(object):
         :param value:
         :return:
         """
-        async with self.server.pipeline(transaction=True) as pipe:
-            for f in self.maps:
-                offset = f.hash(value)
-                pipe.setbit(self.key, offset, 1)
-            await pipe.execute()
+        bf = self.server.bitfield(self.key)
+        for offset in self._offsets(value):
+            bf.set('u1', offset, 1)
+        await bf.execute()
 
 
 class RedisBloomDupeFilter(RedisRFPDupeFilter):
@@ -155,7 +174,7 @@ class ExRedisBloomDupeFilter(RedisBloomDupeFilter):
         fp = await self.bf.exists(request.fingerprint)
         if fp:
             return True
-        async with self.server.pipeline() as pipe:
+        async with self.server.pipeline(transaction=False) as pipe:
             pipe.sadd(self.key_set, request.fingerprint)
             pipe.expire(self.key_set, self.ttl)
             ret, _ = await pipe.execute()
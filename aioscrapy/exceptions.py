@@ -99,13 +99,19 @@ class DownloadError(Exception):
 
     def __init__(self, *args, real_error=None):
         self.real_error = real_error
+        self._str = None
         super().__init__(*args)
 
     def __str__(self):
-        if not self.real_error:
-            return "DownloadError"
-
-        return f"{self.real_error.__class__.__module__}.{self.real_error.__class__.__name__}: {str(self.real_error)}"
+        s = self._str
+        if s is None:
+            if not self.real_error:
+                s = "DownloadError"
+            else:
+                cls = self.real_error.__class__
+                s = f"{cls.__module__}.{cls.__name__}: {self.real_error}"
+            self._str = s
+        return s
 
 
 if __name__ == '__main__':
@@ -1,5 +1,42 @@
 from collections.abc import Mapping
 
+_COMMON_HEADERS = (
+    'Accept', 'Accept-Charset', 'Accept-Encoding', 'Accept-Language', 'Accept-Ranges',
+    'Access-Control-Allow-Credentials', 'Access-Control-Allow-Headers', 'Access-Control-Allow-Methods',
+    'Access-Control-Allow-Origin', 'Access-Control-Expose-Headers', 'Access-Control-Max-Age', 'Age',
+    'Allow', 'Authorization', 'Cache-Control', 'Connection', 'Content-Disposition', 'Content-Encoding',
+    'Content-Language', 'Content-Length', 'Content-Location', 'Content-Range', 'Content-Security-Policy',
+    'Content-Type', 'Cookie', 'Date', 'DNT', 'ETag', 'Expect', 'Expires', 'Forwarded', 'From', 'Host',
+    'If-Match', 'If-Modified-Since', 'If-None-Match', 'If-Range', 'If-Unmodified-Since', 'Keep-Alive',
+    'Last-Modified', 'Link', 'Location', 'Origin', 'Pragma', 'Proxy-Authenticate', 'Proxy-Authorization',
+    'Proxy-Connection', 'Range', 'Referer', 'Referrer-Policy', 'Retry-After', 'Server', 'Set-Cookie',
+    'Strict-Transport-Security', 'TE', 'Trailer', 'Transfer-Encoding', 'Upgrade',
+    'Upgrade-Insecure-Requests', 'User-Agent', 'Vary', 'Via', 'Warning', 'WWW-Authenticate',
+    'X-Content-Type-Options', 'X-Forwarded-For', 'X-Frame-Options', 'X-Requested-With',
+    'X-XSS-Protection',
+)
+
+_NORMKEY_CACHE_SIZE = 512
+# seeded with the usual spellings of well-known names, filled with the rest as they are seen
+_normkey_cache = {
+    spelling: name.title()
+    for name in _COMMON_HEADERS
+    for spelling in (name, name.lower(), name.title())
+}
+
+
+def _normkey(key):
+    """Title-case a header name, remembering the result for the few names a crawl uses"""
+    try:
+        return _normkey_cache[key]
+    except KeyError:
+        # names such as "Content-Type" are usually sent canonical already; reuse them
+        # instead of building an equal copy through the unicode-aware title()
+        norm = key if key.isascii() and key.istitle() else key.title()
+        if len(_normkey_cache) < _NORMKEY_CACHE_SIZE:
+            _normkey_cache[key] = norm
+        return norm
+
 
 class Headers(dict):
     """Case insensitive http headers dictionary"""
@@ -32,7 +69,7 @@ class Headers(dict):
 
     def normkey(self, key):
         """Method to normalize dictionary key access"""
-        return key.title()
+        return _normkey(key)
 
     def normvalue(self, value):
         """Method to normalize values prior to be setted"""
@@ -46,8 +83,8 @@ class Headers(dict):
 
     def update(self, seq):
         seq = seq.items() if isinstance(seq, Mapping) else seq
-        iseq = ((self.normkey(k), self.normvalue(v)) for k, v in seq)
-        super().update(iseq)
+        normkey, normvalue = self.normkey, self.normvalue
+        super().update({normkey(k): normvalue(v) for k, v in seq})
 
     @classmethod
     def fromkeys(cls, keys, value=None):
@@ -5,9 +5,14 @@ requests in Aioscrapy.
 See documentation in docs/topics/request-response.rst
 """
 import hashlib
-import inspect
 import json
-from typing import Callable, List, Optional, Tuple, Type, TypeVar
+import re
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+from types import FunctionType, MethodType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 from w3lib.url import canonicalize_url
 from w3lib.url import safe_url_string
@@ -15,18 +20,63 @@ from w3lib.url import safe_url_string
 import aioscrapy
 from aioscrapy.http.headers import Headers
 from aioscrapy.utils.curl import curl_to_request_kwargs
-from aioscrapy.utils.python import to_unicode
 from aioscrapy.utils.url import escape_ajax
 
 RequestTypeVar = TypeVar("RequestTypeVar", bound="Request")
 
+# same output as json.dumps(..., sort_keys=True) without building a new encoder per call
+_fingerprint_encoder = json.JSONEncoder(sort_keys=True)
+_GET_FINGERPRINT_PREFIX = '{"body": "", "method": "GET", "url": '
+
+# shared upper-case method names, keyed by their usual spellings
+_METHODS = {
+    spelling: method
+    for method in ('GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS', 'PATCH', 'CONNECT', 'TRACE')
+    for spelling in (method, method.lower())
+}
+
+# absolute http(s) urls that safe_url_string() and escape_ajax() return unchanged
+# with every supported w3lib release: 2.1+ quotes "'" in the query and 2.5+
+# adds the '/' of an empty path, so neither is part of the fast path
+_SAFE_URL_RE = re.compile(
+    r"https?://[a-z0-9-]+(?:\.[a-z0-9-]+)*(?::[1-9][0-9]{0,3})?"
+    r"(?:/[A-Za-z0-9\-._~!$&()*+,;=:@/?]*)?(?<!\?)\Z"
+)
+
+# url prefixes accepted without looking for '://' anywhere in the url
+_SCHEME_PREFIXES = ('http://', 'https://', 'about:', 'data:')
+
+# request class -> names of its slots, filled by _instance_slots
+_instance_slots_cache: Dict[type, Tuple[str, ...]] = {}
+
+# request class -> getter of all its attributes for replace, filled by _replace_getter
+_replace_getters_cache: Dict[type, attrgetter] = {}
+
+# request class -> (attribute names, getter) for to_dict, filled by _to_dict_getter
+_to_dict_getters_cache: Dict[type, Tuple[Tuple[str, ...], attrgetter]] = {}
+
+# attributes read from their slot instead of the public property:
+# don't compute the fingerprint or create empty headers/cookies just to copy them
+_RAW_ATTRIBUTES = {'fingerprint': '_fingerprint', 'headers': '_headers', 'cookies': '_cookies'}
+
+# spider class -> {function: its method names, sorted}, filled by _find_method
+_method_names_cache: "WeakKeyDictionary[type, Dict[Callable, Tuple[str, ...]]]" = WeakKeyDictionary()
+
 
 class Request(object):
+    # '__dict__' keeps ad-hoc attributes working, e.g. the scraper's parse_ok flag
+    __slots__ = (
+        '_encoding', 'method', '_url', '_body', 'priority',
+        'callback', 'errback', '_cookies', '_headers', 'dont_filter',
+        'use_proxy', 'meta', 'cb_kwargs', 'flags', '_fingerprint',
+        '__dict__', '__weakref__',
+    )
+
     attributes: Tuple[str, ...] = (
         "url", "callback", "method", "headers", "body",
         "cookies", "meta", "encoding", "priority",
         "dont_filter", "errback", "flags", "cb_kwargs",
-        "use_proxy"
+        "use_proxy", "fingerprint"
     )
 
     def __init__(
@@ -49,7 +99,7 @@ class Request(object):
     ):
 
         self._encoding = encoding
-        self.method = str(method).upper()
+        self.method = _METHODS.get(method) or str(method).upper()
         self._set_url(url)
         self._set_body(body)
         assert isinstance(priority, int), f"Request priority not an integer: {priority!r}"
@@ -58,63 +108,77 @@ class Request(object):
         self.callback = callback
         self.errback = errback
 
-        self.cookies = cookies or {}
-        self.headers = Headers(headers or {})
+        self._cookies = cookies or None
+        self._headers = Headers(headers) if headers else None
         self.dont_filter = dont_filter
         self.use_proxy = use_proxy
 
-        self._meta = dict(meta) if meta else {}
-        if fingerprint is not None:
-            self._set_fingerprint(fingerprint)
-        self._cb_kwargs = dict(cb_kwargs) if cb_kwargs else None
+        self.meta = dict(meta) if meta else {}
+        self.cb_kwargs = dict(cb_kwargs) if cb_kwargs else {}
+        # requests serialized by older versions carry their fingerprint in meta
+        self._fingerprint = fingerprint or self.meta.pop('_fingerprint', None)
         self.flags = [] if flags is None else list(flags)
 
     @property
-    def cb_kwargs(self) -> dict:
-        if self._cb_kwargs is None:
-            self._cb_kwargs = {}
-        return self._cb_kwargs
+    def headers(self) -> Headers:
+        if self._headers is None:
+            self._headers = Headers()
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: dict) -> None:
+        self._headers = headers
 
     @property
-    def meta(self) -> dict:
-        if self._meta is None:
-            self._meta = {}
-        return self._meta
+    def cookies(self) -> dict:
+        if self._cookies is None:
+            self._cookies = {}
+        return self._cookies
 
-    def _get_url(self) -> str:
-        return self._url
+    @cookies.setter
+    def cookies(self, cookies: dict) -> None:
+        self._cookies = cookies
 
     def _set_url(self, url: str) -> None:
         if not isinstance(url, str):
             raise TypeError(f'Request url must be str or unicode, got {type(url).__name__}')
 
-        s = safe_url_string(url, self.encoding)
-        self._url = escape_ajax(s)
+        if _SAFE_URL_RE.match(url):
+            # the common case, e.g. links taken from a page: nothing to quote or escape
+            self._url = url
+            return
 
-        if (
-                '://' not in self._url
-                and not self._url.startswith('about:')
-                and not self._url.startswith('data:')
-        ):
-            raise ValueError(f'Missing scheme in request url: {self._url}')
+        url = self._url = escape_ajax(safe_url_string(url, self.encoding))
 
-    url = property(_get_url, _set_url)
-
-    def _get_body(self) -> str:
-        return self._body
+        if not url.startswith(_SCHEME_PREFIXES) and '://' not in url:
+            raise ValueError(f'Missing scheme in request url: {url}')
 
     def _set_body(self, body: str) -> None:
         self._body = '' if body is None else body
 
-    body = property(_get_body, _set_body)
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @url.setter
+    def url(self, url: str) -> None:
+        self._set_url(url)
+
+    @property
+    def body(self) -> str:
+        return self._body
+
+    @body.setter
+    def body(self, body: str) -> None:
+        self._set_body(body)
 
     def _set_fingerprint(self, fingerprint: str) -> None:
-        self._meta['_fingerprint'] = fingerprint
+        self._fingerprint = fingerprint
 
     def _get_fingerprint(self) -> str:
-        if not self._meta.get('_fingerprint'):
-            self._meta['_fingerprint'] = self.make_fingerprint()
-        return self._meta.get('_fingerprint')
+        if not self._fingerprint:
+            self._fingerprint = self.make_fingerprint()
+        return self._fingerprint
 
     fingerprint = property(_get_fingerprint, _set_fingerprint)
 
@@ -129,12 +193,30 @@ class Request(object):
 
     def copy(self) -> "Request":
         """Return a copy of this Request"""
-        return self.replace()
+        # Copy the state directly instead of going through replace() and __init__:
+        # the url is already safe and validated, only the containers need new copies.
+        if getattr(self, '__dict__', None):
+            # attributes outside the slots, set by a subclass __init__ or attached later
+            # on (like the scraper's parse_ok): only __init__ knows which a copy gets
+            return self.replace()
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for name in _instance_slots(cls):
+            try:
+                setattr(new, name, getattr(self, name))
+            except AttributeError:
+                pass
+        new._headers = Headers(self._headers) if self._headers else None
+        new._cookies = dict(self._cookies) if self._cookies else None
+        new.meta = dict(self.meta) if self.meta else {}
+        new.cb_kwargs = dict(self.cb_kwargs) if self.cb_kwargs else {}
+        new.flags = list(self.flags)
+        return new
 
     def replace(self, *args, **kwargs) -> "Request":
         """Create a new Request with the same attributes except for those given new values."""
-        for x in self.attributes:
-            kwargs.setdefault(x, getattr(self, x))
+        for x, value in zip(self.attributes, _replace_getter(type(self))(self)):
+            kwargs.setdefault(x, value)
         cls = kwargs.pop('cls', self.__class__)
         return cls(*args, **kwargs)
 
@@ -147,52 +229,159 @@ class Request(object):
         request_kwargs.update(kwargs)
         return cls(**request_kwargs)
 
+    @classmethod
+    def bulk_create(cls: Type[RequestTypeVar], urls: Iterable[str], **kwargs) -> List[RequestTypeVar]:
+        """Create one Request per url, all sharing the other given arguments.
+
+        The arguments are processed once for the first url, the next requests are copies
+        of it with their own url, so url rewrites done by a subclass constructor (like
+        FormRequest with GET formdata) only apply to the first one.
+        """
+        urls = iter(urls)
+        try:
+            template = cls(next(urls), **kwargs)
+        except StopIteration:
+            return []
+        requests = [template]
+        for url in urls:
+            request = template.copy()
+            request._set_url(url)
+            requests.append(request)
+        return requests
+
     def make_fingerprint(
             self,
             keep_fragments: bool = False,
     ) -> str:
         """ make the request fingerprint. """
-        return hashlib.sha1(
-            json.dumps({
-                'method': to_unicode(self.method),
-                'url': canonicalize_url(self.url, keep_fragments=keep_fragments),
-                'body': self.body,
-            }, sort_keys=True).encode()
-        ).hexdigest()
-
-    def to_dict(self, *, spider: Optional["aioscrapy.Spider"] = None) -> dict:
+        return hashlib.sha1(self._fingerprint_payload(keep_fragments), usedforsecurity=False).hexdigest()
+
+    def _fingerprint_payload(self, keep_fragments: bool = False) -> bytes:
+        """ the bytes hashed into the request fingerprint. """
+        url = _canonicalize_url(self.url, keep_fragments)
+        body = self.body
+        if type(body) is not str:
+            return _fingerprint_encoder.encode({'method': self.method, 'url': url, 'body': body}).encode()
+        if not body and self.method == 'GET':
+            # most requests of a crawl, only the url varies
+            return f'{_GET_FINGERPRINT_PREFIX}{encode_basestring_ascii(url)}}}'.encode()
+        # the keys are fixed, so lay them out in sorted order directly
+        return (
+            f'{{"body": {encode_basestring_ascii(body)}, '
+            f'"method": {encode_basestring_ascii(self.method)}, '
+            f'"url": {encode_basestring_ascii(url)}}}'
+        ).encode()
+
+    def to_dict(self, *, spider: Optional["aioscrapy.Spider"] = None, shallow: bool = False) -> dict:
         """Return a dictionary containing the Request's data.
 
         Use :func:`~scrapy.utils.request.request_from_dict` to convert back into a :class:`~scrapy.Request` object.
 
         If a spider is given, this method will try to find out the name of the spider methods used as callback
         and errback and include them in the output dict, raising an exception if they cannot be found.
+
+        With shallow, the headers are not copied into a new dict: only for callers that serialize
+        the output right away and don't modify it.
         """
         d = {
             "url": self.url,  # urls are safe (safe_string_url)
             "callback": _find_method(spider, self.callback) if callable(self.callback) else self.callback,
             "errback": _find_method(spider, self.errback) if callable(self.errback) else self.errback,
-            "headers": dict(self.headers),
+            "headers": (self._headers if shallow else dict(self._headers)) if self._headers else {},
+            "cookies": self._cookies or {},
         }
 
-        for attr in self.attributes:
-            d.setdefault(attr, getattr(self, attr))
+        names, getter = _to_dict_getter(type(self))
+        d.update(zip(names, getter(self)))
         if type(self) is not Request:
             d["_class"] = self.__module__ + '.' + self.__class__.__name__
         return d
 
 
+def _instance_slots(cls: type) -> Tuple[str, ...]:
+    """Names of all slots the instances of cls carry, used by Request.copy"""
+    slots = _instance_slots_cache.get(cls)
+    if slots is None:
+        slots = _instance_slots_cache[cls] = tuple(
+            name
+            for klass in cls.__mro__
+            for name in klass.__dict__.get('__slots__', ())
+            if name not in ('__dict__', '__weakref__')
+        )
+    return slots
+
+
+def _replace_getter(cls: type) -> attrgetter:
+    """One getter reading all the attributes of a cls instance, in order, for Request.replace"""
+    getter = _replace_getters_cache.get(cls)
+    if getter is None:
+        getter = _replace_getters_cache[cls] = attrgetter(
+            *(_RAW_ATTRIBUTES.get(attr, attr) for attr in cls.attributes)
+        )
+    return getter
+
+
+def _to_dict_getter(cls: type) -> Tuple[Tuple[str, ...], attrgetter]:
+    """Names of the remaining attributes Request.to_dict exports and one getter reading them all"""
+    cached = _to_dict_getters_cache.get(cls)
+    if cached is None:
+        names = tuple(
+            attr for attr in cls.attributes
+            if attr not in ('url', 'callback', 'errback', 'headers', 'cookies')
+        )
+        getter = attrgetter(*(_RAW_ATTRIBUTES.get(attr, attr) for attr in names))
+        cached = _to_dict_getters_cache[cls] = (names, getter)
+    return cached
+
+
+@lru_cache(maxsize=10000)
+def _canonicalize_url(url: str, keep_fragments: bool) -> str:
+    """canonicalize_url for fingerprints, the same urls come back with retries and copies"""
+    return canonicalize_url(url, keep_fragments=keep_fragments)
+
+
 def _find_method(obj, func):
     """Helper function for Request.to_dict"""
     # Only instance methods contain ``__func__``
     if obj and hasattr(func, '__func__'):
-        members = inspect.getmembers(obj, predicate=inspect.ismethod)
-        for name, obj_func in members:
-            # We need to use __func__ to access the original function object because instance
-            # method objects are generated each time attribute is retrieved from instance.
-            #
-            # Reference: The standard type hierarchy
-            # https://docs.python.org/3/reference/datamodel.html
-            if obj_func.__func__ is func.__func__:
-                return name
+        names = _method_names_cache.get(type(obj))
+        if names is None:
+            names = _method_names_cache[type(obj)] = _method_names(type(obj))
+        # the instance attributes belong to this spider only: they are looked at on every
+        # call, and hide the class attributes of the same name
+        instance_members = getattr(obj, '__dict__', {})
+        candidates = [name for name in names.get(func.__func__, ()) if name not in instance_members]
+        candidates.extend(
+            name for name, value in instance_members.items()
+            if isinstance(value, MethodType) and value.__func__ is func.__func__
+        )
+        if candidates:
+            return min(candidates)
     raise ValueError(f"Function {func} is not an instance method in: {obj}")
+
+
+def _method_names(cls: type) -> Dict[Callable, Tuple[str, ...]]:
+    """Map the functions behind the methods of cls to their names"""
+    # Read the raw namespaces instead of inspect.getmembers(obj), which calls getattr on
+    # every name and so runs every property of the spider. We need the function object
+    # (``__func__``) anyway, as instance method objects are generated each time the
+    # attribute is retrieved from the instance.
+    #
+    # Reference: The standard type hierarchy
+    # https://docs.python.org/3/reference/datamodel.html
+    members = {}
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name in members:
+                continue  # shadowed by a subclass
+            if isinstance(value, FunctionType):
+                members[name] = value
+            elif isinstance(value, (classmethod, MethodType)):
+                members[name] = value.__func__
+            else:
+                members[name] = None
+    names = {}
+    for name in sorted(members):
+        if members[name] is not None:
+            names.setdefault(members[name], []).append(name)
+    return {function: tuple(function_names) for function, function_names in names.items()}
@@ -4,6 +4,7 @@ This module implements the FormRequest class which is a more convenient class
 
 See documentation in docs/topics/request-response.rst
 """
+from functools import lru_cache
 from typing import List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
@@ -14,6 +15,8 @@ FormdataType = Optional[Union[dict, List[Tuple[str, str]]]]
 
 
 class FormRequest(Request):
+    __slots__ = ()
+
     valid_form_methods = ['GET', 'POST']
 
     def __init__(self, *args, formdata: FormdataType = None, **kwargs) -> None:
@@ -33,7 +36,19 @@ class FormRequest(Request):
 
 
 def _urlencode(seq, enc):
-    values = [(to_bytes(k, enc), to_bytes(v, enc))
-              for k, vs in seq
-              for v in (vs if is_listlike(vs) else [vs])]
-    return urlencode(values, doseq=1)
+    # spiders send the same forms (logins, searches) over and over, so the
+    # encoded query is memoized on the flattened, hashable form of the data
+    items = tuple((k, tuple(vs) if is_listlike(vs) else (vs,)) for k, vs in seq)
+    try:
+        return _urlencode_items(items, enc)
+    except TypeError:  # unhashable keys or values, to_bytes will tell
+        return _urlencode_items.__wrapped__(items, enc)
+
+
+@lru_cache(maxsize=4096)
+def _urlencode_items(items, enc):
+    values = [(k, v) for k, vs in items for v in vs]
+    if not all(isinstance(k, (str, bytes)) and isinstance(v, (str, bytes)) for k, v in values):
+        values = [(to_bytes(k, enc), to_bytes(v, enc)) for k, v in values]  # raises TypeError
+    # urlencode encodes str keys and values with enc itself, no need to do it up front
+    return urlencode(values, doseq=1, encoding=enc)
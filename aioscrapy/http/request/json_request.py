@@ -5,7 +5,6 @@ This module implements the JsonRequest class which is a more convenient class
 See documentation in docs/topics/request-response.rst
 """
 
-import copy
 import json
 import warnings
 from typing import Optional, Tuple
@@ -15,11 +14,13 @@ from aioscrapy.utils.deprecate import create_deprecated_class
 
 
 class JsonRequest(Request):
+    __slots__ = ('_dumps_kwargs',)
+
     attributes: Tuple[str, ...] = Request.attributes + ("dumps_kwargs",)
 
     def __init__(self, *args, dumps_kwargs: Optional[dict] = None, **kwargs) -> None:
-        dumps_kwargs = copy.deepcopy(dumps_kwargs) if dumps_kwargs is not None else {}
-        self._dumps_kwargs = dumps_kwargs
+        # json.dumps options are flat values, a shallow copy keeps the caller's dict apart
+        self._dumps_kwargs = dict(dumps_kwargs) if dumps_kwargs else {}
 
         body_passed = kwargs.get('body', None) is not None
         data = kwargs.pop('data', None)
@@ -55,6 +56,11 @@ class JsonRequest(Request):
 
         return super().replace(*args, **kwargs)
 
+    def copy(self) -> Request:
+        new = super().copy()
+        new._dumps_kwargs = dict(self._dumps_kwargs)
+        return new
+
     def _dumps(self, data: dict) -> str:
         """Convert to JSON """
         return json.dumps(data, **self._dumps_kwargs)
@@ -4,15 +4,40 @@ responses in aioscrapy.
 
 See documentation in docs/topics/request-response.rst
 """
-from typing import Generator, Optional
+import re
+from functools import partial
+from operator import attrgetter
+from typing import Dict, Generator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 from aioscrapy.exceptions import NotSupported
 from aioscrapy.http.request import Request
 from aioscrapy.link import Link
 
+# absolute http(s) urls that urljoin() would return unchanged whatever the base url
+_ABSOLUTE_URL_RE = re.compile(
+    r"https?://[^/?#\[\]\x00-\x20\x7f]+(?:/[^?#\x00-\x20\x7f]*)?(?<!;)"
+    r"(?:\?[^#\x00-\x20\x7f]+)?(?:#[^\x00-\x20\x7f]+)?\Z"
+)
+
+# relative urls joined per response that are kept by Response._urljoin_cached
+_JOIN_CACHE_SIZE = 128
+
+# response class -> getter of all its attributes for replace, filled by Response.replace
+_replace_getters_cache: Dict[type, attrgetter] = {}
+
 
 class Response(object):
+    # __dict__ stays available for attributes that middlewares and spiders attach
+    __slots__ = (
+        '_url', '_body', 'status', 'headers', 'cookies', 'request', 'flags', '_str', '_body_view',
+        '_join_cache',
+        '__dict__', '__weakref__',
+    )
+
+    attributes: Tuple[str, ...] = (
+        "url", "status", "headers", "body", "request", "flags",
+    )
 
     def __init__(
             self,
@@ -31,6 +56,9 @@ class Response(object):
         self.request = request
         self.flags = [] if flags is None else list(flags)
         self.cookies = cookies or {}
+        self._str = None
+        self._body_view = None
+        self._join_cache = None
 
     @property
     def cb_kwargs(self):
@@ -56,7 +84,8 @@ class Response(object):
         return self._url
 
     def _set_url(self, url):
-        if isinstance(url, str):
+        # exact type first, downloaded responses always carry plain str/bytes
+        if type(url) is str or isinstance(url, str):
             self._url = url
         else:
             raise TypeError(f'{type(self).__name__} url must be str, '
@@ -68,7 +97,9 @@ class Response(object):
         return self._body
 
     def _set_body(self, body):
-        if body is None:
+        if type(body) is bytes:
+            self._body = body
+        elif body is None:
             self._body = b''
         elif not isinstance(body, bytes):
             raise TypeError(
@@ -80,8 +111,24 @@ class Response(object):
 
     body = property(_get_body, _set_body)
 
+    @property
+    def body_view(self):
+        """A memoryview of the body, to slice it without copying"""
+        view = self._body_view
+        if view is None or view.obj is not self.body:
+            view = self._body_view = memoryview(self.body)
+        return view
+
+    def body_find(self, sub, start=0, end=None):
+        """Index of sub in the body (like bytes.find), without slicing it first"""
+        return self.body.find(sub, start, end)
+
     def __str__(self):
-        return f"<{self.status} {self.url}>"
+        # (status, url, text): log lines format the same response many times
+        cached = self._str
+        if cached is None or cached[0] is not self.status or cached[1] is not self.url:
+            cached = self._str = (self.status, self.url, f"<{self.status} {self.url}>")
+        return cached[2]
 
     __repr__ = __str__
 
@@ -89,21 +136,46 @@ class Response(object):
         """Return a copy of this Response"""
         return self.replace()
 
-    def replace(self, *args, **kwargs):
+    def replace(self, *args, copy_headers=False, **kwargs):
         """Create a new Response with the same attributes except for those
         given new values.
+
+        Unless new headers are given, the new response shares the headers
+        object of this one, so changing them changes both responses; pass
+        ``copy_headers=True`` to give it a copy instead.
         """
-        for x in [
-            "url", "status", "headers", "body", "request", "flags"
-        ]:
-            kwargs.setdefault(x, getattr(self, x))
+        if copy_headers and 'headers' not in kwargs:
+            kwargs['headers'] = self.headers.copy()
+        getter = _replace_getters_cache.get(type(self))
+        if getter is None:
+            getter = _replace_getters_cache[type(self)] = attrgetter(*self.attributes)
+        for x, value in zip(self.attributes, getter(self)):
+            if x not in kwargs:
+                kwargs[x] = value
         cls = kwargs.pop('cls', self.__class__)
         return cls(*args, **kwargs)
 
     def urljoin(self, url):
         """Join this Response's url with a possible relative url to form an
         absolute interpretation of the latter."""
-        return urljoin(self.url, url)
+        if _ABSOLUTE_URL_RE.match(url):
+            return url
+        return self._urljoin_cached(self.url, url)
+
+    def _urljoin_cached(self, base, url):
+        """urljoin(base, url), remembering a few results: the same relative links
+        (pagination, navigation) are often followed several times from one page"""
+        cache = self._join_cache
+        if cache is None or cache[0] is not base:
+            cache = self._join_cache = (base, {})
+        else:
+            joined = cache[1].get(url)
+            if joined is not None:
+                return joined
+        joined = urljoin(base, url)
+        if len(cache[1]) < _JOIN_CACHE_SIZE:
+            cache[1][url] = joined
+        return joined
 
     @property
     def text(self):
@@ -147,14 +219,8 @@ class Response(object):
         .. versionadded:: 2.0
            The *flags* parameter.
         """
-        if isinstance(url, Link):
-            url = url.url
-        elif url is None:
-            raise ValueError("url can't be None")
-        url = self.urljoin(url)
-
         return Request(
-            url=url,
+            url=self._follow_url(url),
             callback=callback,
             method=method,
             headers=headers,
@@ -170,6 +236,10 @@ class Response(object):
             fingerprint=fingerprint
         )
 
+    # the follow() defined by this class, which only builds a Request from its arguments:
+    # follow_all builds them directly unless a subclass overrides follow()
+    _stock_follow = follow
+
     def follow_all(self, urls, callback=None, method='GET', headers=None, body=None,
                    cookies=None, meta=None, encoding='utf-8', priority=0,
                    dont_filter=False, errback=None, cb_kwargs=None, flags=None):
@@ -186,23 +256,62 @@ class Response(object):
         method which supports selectors in addition to absolute/relative URLs
         and Link objects.
         """
-        if not hasattr(urls, '__iter__'):
-            raise TypeError("'urls' argument must be an iterable")
-        return (
-            self.follow(
-                url=url,
-                callback=callback,
-                method=method,
-                headers=headers,
-                body=body,
-                cookies=cookies,
-                meta=meta,
-                encoding=encoding,
-                priority=priority,
-                dont_filter=dont_filter,
-                errback=errback,
-                cb_kwargs=cb_kwargs,
-                flags=flags,
+        try:
+            urls = iter(urls)
+        except TypeError:
+            raise TypeError("'urls' argument must be an iterable") from None
+        if type(self).follow is not type(self)._stock_follow:
+            # a subclass customizes follow(), every request has to go through it
+            return (
+                self.follow(
+                    url=url,
+                    callback=callback,
+                    method=method,
+                    headers=headers,
+                    body=body,
+                    cookies=cookies,
+                    meta=meta,
+                    encoding=encoding,
+                    priority=priority,
+                    dont_filter=dont_filter,
+                    errback=errback,
+                    cb_kwargs=cb_kwargs,
+                    flags=flags,
+                )
+                for url in urls
             )
-            for url in urls
+        # the arguments are the same for all the requests, bind them once
+        make_request = partial(
+            Request,
+            callback=callback,
+            method=method,
+            headers=headers,
+            body=body,
+            cookies=cookies,
+            meta=meta,
+            encoding=encoding,
+            priority=priority,
+            dont_filter=dont_filter,
+            errback=errback,
+            cb_kwargs=cb_kwargs,
+            flags=flags,
         )
+        follow_url = self._follow_url
+        return (make_request(url=follow_url(url)) for url in urls)
+
+    def follow_batch(self, urls=None, **kwargs):
+        # type: (...) -> List[Request]
+        """
+        Same as :meth:`follow_all`, but build all the requests right away and
+        return them as a list, for callers that need them all anyway.
+        """
+        return list(self.follow_all(urls, **kwargs))
+
+    def _follow_url(self, url):
+        """The absolute url of a follow()/follow_all() target"""
+        if type(url) is not str:  # plain strings are by far the most common
+            if isinstance(url, Link):
+                url = url.url
+            elif url is None:
+                raise ValueError("url can't be None")
+        return self.urljoin(url)
@@ -9,4 +9,4 @@ from aioscrapy.http.response.text import TextResponse
 
 
 class HtmlResponse(TextResponse):
-    pass
+    __slots__ = ()
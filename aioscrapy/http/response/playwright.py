@@ -4,6 +4,8 @@ from aioscrapy.http.response.text import TextResponse
 
 
 class PlaywrightResponse(TextResponse):
+    __slots__ = ('driver', 'driver_pool', '_cache_response', 'intercept_request')
+
     def __init__(
             self,
             *args,
@@ -16,21 +18,31 @@ class PlaywrightResponse(TextResponse):
     ):
         self.driver = driver
         self.driver_pool = driver_pool
-        self._text = text
-        self.cache_response = cache_response or {}
+        self._cache_response = cache_response or None
         self.intercept_request = intercept_request
         super().__init__(*args, **kwargs)
+        if text:
+            # the rendered page is the text, TextResponse.text returns it as is
+            self._cached_ubody = text
 
     async def release(self):
         self.driver_pool and self.driver and await self.driver_pool.release(self.driver)
 
+    @TextResponse.text.setter
+    def text(self, text):
+        self._cached_ubody = text or None
+
     @property
-    def text(self):
-        return self._text or super().text
+    def cache_response(self) -> dict:
+        if self._cache_response is None:
+            self._cache_response = {}
+        return self._cache_response
 
-    @text.setter
-    def text(self, text):
-        self._text = text
+    @cache_response.setter
+    def cache_response(self, cache_response: dict) -> None:
+        self._cache_response = cache_response
 
     def get_response(self, key) -> Any:
-        return self.cache_response.get(key)
+        if self._cache_response is None:
+            return None
+        return self._cache_response.get(key)
@@ -5,48 +5,57 @@ discovering (through HTTP headers) to base Response class.
 See documentation in docs/topics/request-response.rst
 """
 
+import codecs
+import re
 import warnings
 from contextlib import suppress
-from typing import Generator
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Generator, Iterable
 
 import parsel
 import ujson
+from lxml import etree
 from parsel import Selector
+from parsel.csstranslator import GenericTranslator, HTMLTranslator
 from w3lib.encoding import (html_body_declared_encoding, html_to_unicode,
-                            http_content_type_encoding, resolve_encoding)
-from w3lib.html import strip_html5_whitespace
+                            http_content_type_encoding, read_bom, resolve_encoding)
+from w3lib.html import HTML5_WHITESPACE
 
 from aioscrapy.exceptions import AioScrapyDeprecationWarning
 from aioscrapy.http import Request
-from aioscrapy.http.response import Response
+from aioscrapy.http.response import Response, _ABSOLUTE_URL_RE
 from aioscrapy.utils.python import memoizemethod_noargs, to_unicode
 from aioscrapy.utils.response import get_base_url
 
 _NONE = object()
 
+# application/json, text/json, application/ld+json, application/vnd.api+json, ...
+_JSON_CONTENT_TYPE_RE = re.compile(r'^\s*[\w.+-]+/(?:[\w.+-]+\+)?json\b', re.I)
+
+_CSS_TRANSLATORS = {'html': HTMLTranslator(), 'xml': GenericTranslator()}
+
 
 class TextResponse(Response):
+    __slots__ = (
+        '_encoding', '_cached_encoding', '_cached_benc', '_cached_ubody', '_cached_selector',
+        '_cached_decoded_json',
+    )
 
     _DEFAULT_ENCODING = 'ascii'
-    _cached_decoded_json = _NONE
 
     def __init__(self, *args, encoding=None, **kwargs):
         self._encoding = encoding
+        self._cached_encoding = None
         self._cached_benc = None
         self._cached_ubody = None
         self._cached_selector = None
+        self._cached_decoded_json = _NONE
         super().__init__(*args, **kwargs)
 
-    def _set_url(self, url):
-        if isinstance(url, str):
-            self._url = to_unicode(url, self.encoding)
-        else:
-            super()._set_url(url)
-
     def _set_body(self, body):
-        self._body = b''  # used by encoding detection
-        if isinstance(body, str):
+        if type(body) is bytes:
+            self._body = body
+        elif isinstance(body, str):
             if self._encoding is None:
                 raise TypeError('Cannot convert unicode body - '
                                 f'{type(self).__name__} has no encoding')
@@ -55,12 +64,22 @@ class TextResponse(Response):
             super()._set_body(body)
 
     def replace(self, *args, **kwargs):
-        kwargs.setdefault('encoding', self.encoding)
-        return Response.replace(self, *args, **kwargs)
+        encoding = self.encoding
+        kwargs.setdefault('encoding', encoding)
+        response = Response.replace(self, *args, **kwargs)
+        if (not args and 'body' not in kwargs and kwargs['encoding'] == encoding
+                and isinstance(response, TextResponse) and response._cached_ubody is None):
+            # same body and encoding (e.g. only meta changed): reuse the decoded text.
+            # Not the selector, its lxml tree can be modified (e.g. Selector.drop())
+            response._cached_ubody = self._cached_ubody
+        return response
 
     @property
     def encoding(self):
-        return self._declared_encoding() or self._body_inferred_encoding()
+        encoding = self._cached_encoding
+        if encoding is None:
+            encoding = self._cached_encoding = self._declared_encoding() or self._body_inferred_encoding()
+        return encoding
 
     def _declared_encoding(self):
         return (
@@ -83,23 +102,50 @@ class TextResponse(Response):
         Deserialize a JSON document to a Python object.
         """
         if self._cached_decoded_json is _NONE:
-            self._cached_decoded_json = ujson.loads(self.text)
+            self._cached_decoded_json = self._json_loads()
         return self._cached_decoded_json
 
+    def _json_loads(self):
+        encoding = self._declared_encoding()
+        if encoding is None or resolve_encoding(encoding) == 'utf-8':
+            # JSON is UTF-8 unless declared otherwise: parse the body bytes
+            # directly instead of building a str copy of the whole body first
+            try:
+                return ujson.loads(self.body)
+            except ValueError:
+                # a BOM, another encoding or lenient JSON, let the text path decide
+                pass
+        return ujson.loads(self.text)
+
     @property
     def text(self):
         """ Body as unicode """
-        # access self.encoding before _cached_ubody to make sure
-        # _body_inferred_encoding is called
+        if self._cached_ubody is not None:
+            return self._cached_ubody
+        # an inferred encoding decodes the body along the way
+        encoding = self.encoding
         if self._cached_ubody is None:
-            charset = f'charset={self.encoding}'
-            self._cached_ubody = html_to_unicode(charset, self.body)[1]
+            resolved = resolve_encoding(encoding)
+            if resolved == 'utf-8':
+                # what html_to_unicode does for these, without its header parsing
+                body = self.body
+                if body.startswith(codecs.BOM_UTF8):
+                    body = body[len(codecs.BOM_UTF8):]
+                self._cached_ubody = body.decode(resolved, 'replace')
+            elif resolved == 'cp1252':
+                self._cached_ubody = self.body.decode(resolved, 'replace')
+            else:
+                charset = f'charset={encoding}'
+                self._cached_ubody = html_to_unicode(charset, self.body)[1]
         return self._cached_ubody
 
     def urljoin(self, url):
         """Join this Response's url with a possible relative url to form an
         absolute interpretation of the latter."""
-        return urljoin(get_base_url(self), url)
+        if _ABSOLUTE_URL_RE.match(url):
+            # no need to look for a <base> tag in the body
+            return url
+        return self._urljoin_cached(get_base_url(self), url)
 
     @memoizemethod_noargs
     def _headers_encoding(self):
@@ -108,37 +154,103 @@ class TextResponse(Response):
 
     def _body_inferred_encoding(self):
         if self._cached_benc is None:
-            content_type = to_unicode(self.headers.get('Content-Type', ''))
-            benc, ubody = html_to_unicode(content_type, self.body,
-                                          auto_detect_fun=self._auto_detect_fun,
-                                          default_encoding=self._DEFAULT_ENCODING)
+            benc, ubody = self._decode_body()
             self._cached_benc = benc
-            self._cached_ubody = ubody
+            if self._cached_ubody is None:
+                # the text can be known already, e.g. a page rendered by a browser
+                self._cached_ubody = ubody
         return self._cached_benc
 
+    def _decode_body(self):
+        """
+        Infer the body encoding and decode the body with it
+        :return: (encoding, text) tuple
+        """
+        content_type = to_unicode(self.headers.get('Content-Type', ''))
+        body = self.body
+        bom_enc, bom = read_bom(body)
+        if bom_enc is None and _JSON_CONTENT_TYPE_RE.match(content_type):
+            # JSON without a charset is UTF-8 (RFC 8259): when the body decodes as
+            # such, keep that text instead of running the encoding detection
+            with suppress(UnicodeDecodeError):
+                return 'utf-8', body.decode('utf-8')
+        if self._headers_encoding() or self._body_declared_encoding():
+            return html_to_unicode(content_type, body,
+                                   auto_detect_fun=self._auto_detect_fun,
+                                   default_encoding=self._DEFAULT_ENCODING)
+        if bom_enc is not None:
+            return bom_enc, body[len(bom):].decode(bom_enc, 'replace')
+        # the rest of html_to_unicode, without scanning the headers and
+        # the body head again for a charset _declared_encoding didn't find
+        return self._auto_detect_unicode(body)
+
     def _auto_detect_fun(self, text):
+        # bytes.isascii() is a single scan without building a str, so the
+        # 'ascii' candidate never needs a trial decode
+        is_ascii = text.isascii()
         for enc in (self._DEFAULT_ENCODING, 'utf-8', 'cp1252'):
+            if enc == 'ascii':
+                if is_ascii:
+                    return resolve_encoding(enc)
+                continue
             try:
                 text.decode(enc)
             except UnicodeError:
                 continue
             return resolve_encoding(enc)
 
+    def _auto_detect_unicode(self, body):
+        """
+        Same as _auto_detect_fun followed by the decode in html_to_unicode,
+        reusing the trial decode that succeeded
+        :return: (encoding, text) tuple
+        """
+        for enc in (self._DEFAULT_ENCODING, 'utf-8', 'cp1252'):
+            if enc == 'ascii':
+                if body.isascii():
+                    return resolve_encoding(enc), body.decode(enc)
+                continue
+            try:
+                text = body.decode(enc)
+            except UnicodeError:
+                continue
+            benc = resolve_encoding(enc)
+            if benc == enc:
+                return benc, text
+            if benc is not None:
+                return benc, body.decode(benc, 'replace')
+            break
+        return self._DEFAULT_ENCODING, body.decode(self._DEFAULT_ENCODING, 'replace')
+
     @memoizemethod_noargs
     def _body_declared_encoding(self):
+        if _JSON_CONTENT_TYPE_RE.match(to_unicode(self.headers.get('Content-Type', ''))):
+            # JSON has no <meta> or XML declaration, whatever its strings contain
+            return None
         return html_body_declared_encoding(self.body)
 
     @property
     def selector(self):
         if self._cached_selector is None:
-            self._cached_selector = Selector(self.text)
+            encoding = self.encoding
+            if (self.body and self._cached_ubody is None and resolve_encoding(encoding) == 'utf-8'
+                    and not self.body.startswith(codecs.BOM_UTF8)):
+                # lxml parses UTF-8 bytes natively, no need to build self.text
+                # only for parsel to encode it back to UTF-8 (parsel rejects an
+                # empty body, the text path handles it)
+                self._cached_selector = Selector(body=self.body, encoding='utf-8')
+            else:
+                self._cached_selector = Selector(self.text)
         return self._cached_selector
 
     def xpath(self, query, **kwargs):
         return self.selector.xpath(query, **kwargs)
 
     def css(self, query):
-        return self.selector.css(query)
+        selector = self.selector
+        if selector.type in _CSS_TRANSLATORS:
+            return selector.xpath(_css_to_xpath(query, selector.type))
+        return selector.css(query)
 
     def follow(self, url, callback=None, method='GET', headers=None, body=None,
                cookies=None, meta=None, encoding=None, priority=0, dont_filter=False,
@@ -160,10 +272,6 @@ class TextResponse(Response):
 
         See :ref:`response-follow-example` for usage examples.
         """
-        if isinstance(url, parsel.Selector):
-            url = _url_from_selector(url)
-        elif isinstance(url, parsel.SelectorList):
-            raise ValueError("SelectorList is not supported")
         encoding = self.encoding if encoding is None else encoding
         return super().follow(
             url=url,
@@ -182,6 +290,8 @@ class TextResponse(Response):
             fingerprint=fingerprint
         )
 
+    _stock_follow = follow
+
     def follow_all(self, urls=None, callback=None, method='GET', headers=None, body=None,
                    cookies=None, meta=None, encoding=None, priority=0,
                    dont_filter=False, errback=None, cb_kwargs=None, flags=None,
@@ -215,17 +325,20 @@ class TextResponse(Response):
             raise ValueError(
                 "Please supply exactly one of the following arguments: urls, css, xpath"
             )
-        if not urls:
-            if css:
+        if not urls and (css or xpath):
+            selector = self.selector
+            if selector.type in _CSS_TRANSLATORS and hasattr(selector.root, 'xpath'):
+                # read the links straight from the lxml results, without
+                # wrapping every match in a Selector first
+                query = _css_to_xpath(css, selector.type) if css else xpath
+                urls = _urls_from_roots(_xpath_roots(selector, query))
+            elif css:
                 urls = self.css(css)
-            if xpath:
+            else:
                 urls = self.xpath(xpath)
         if isinstance(urls, parsel.SelectorList):
-            selectors = urls
-            urls = []
-            for sel in selectors:
-                with suppress(_InvalidSelector):
-                    urls.append(_url_from_selector(sel))
+            urls = _urls_from_roots(sel.root for sel in urls)
+        encoding = self.encoding if encoding is None else encoding
         return super().follow_all(
             urls=urls,
             callback=callback,
@@ -242,6 +355,22 @@ class TextResponse(Response):
             flags=flags,
         )
 
+    def _follow_url(self, url):
+        if type(url) is str:
+            return self.urljoin(url)
+        if isinstance(url, parsel.Selector):
+            url = _url_from_selector(url)
+        elif isinstance(url, parsel.SelectorList):
+            raise ValueError("SelectorList is not supported")
+        return super()._follow_url(url)
+
+
+@lru_cache(maxsize=1024)
+def _css_to_xpath(query, selector_type):
+    # spiders run the same few CSS queries on every page, keep their
+    # translations process-wide instead of in parsel's smaller cache
+    return _CSS_TRANSLATORS[selector_type].css_to_xpath(query)
+
 
 class _InvalidSelector(ValueError):
     """
@@ -249,11 +378,40 @@ class _InvalidSelector(ValueError):
     """
 
 
+def _xpath_roots(selector, query):
+    # type: (parsel.Selector, str) -> list
+    """
+    The roots of the selectors ``selector.xpath(query)`` would return
+    """
+    try:
+        result = selector.root.xpath(query, namespaces=selector.namespaces, smart_strings=False)
+    except etree.XPathError as exc:
+        raise ValueError(f"XPath error: {exc} in {query}")
+    return result if isinstance(result, list) else [result]
+
+
+def _urls_from_roots(roots):
+    # type: (Iterable) -> list
+    """
+    Same as calling ``_url_from_selector`` on the selector of each root and
+    skipping the invalid ones, without the per-link call and exception overhead
+    """
+    urls = []
+    for root in roots:
+        if isinstance(root, str):
+            urls.append(root.strip(HTML5_WHITESPACE))
+        elif getattr(root, 'tag', None) in ('a', 'link'):
+            href = root.get('href')
+            if href is not None:
+                urls.append(href.strip(HTML5_WHITESPACE))
+    return urls
+
+
 def _url_from_selector(sel):
     # type: (parsel.Selector) -> str
     if isinstance(sel.root, str):
         # e.g. ::attr(href) result
-        return strip_html5_whitespace(sel.root)
+        return sel.root.strip(HTML5_WHITESPACE)
     if not hasattr(sel.root, 'tag'):
         raise _InvalidSelector(f"Unsupported selector: {sel}")
     if sel.root.tag not in ('a', 'link'):
@@ -262,4 +420,4 @@ def _url_from_selector(sel):
     href = sel.root.get('href')
     if href is None:
         raise _InvalidSelector(f"<{sel.root.tag}> element has no href attribute: {sel}")
-    return strip_html5_whitespace(href)
+    return href.strip(HTML5_WHITESPACE)
@@ -9,4 +9,4 @@ from aioscrapy.http.response.text import TextResponse
 
 
 class XmlResponse(TextResponse):
-    pass
+    __slots__ = ()
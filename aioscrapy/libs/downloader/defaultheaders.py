@@ -10,7 +10,7 @@ from aioscrapy.utils.python import without_none_values
 class DefaultHeadersMiddleware:
 
     def __init__(self, headers):
-        self._headers = headers
+        self._headers = tuple(headers)
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -18,5 +18,6 @@ class DefaultHeadersMiddleware:
         return cls(headers.items())
 
     def process_request(self, request, spider):
+        setdefault = request.headers.setdefault
         for k, v in self._headers:
-            request.headers.setdefault(k, v)
+            setdefault(k, v)
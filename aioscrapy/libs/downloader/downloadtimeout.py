@@ -22,5 +22,8 @@ class DownloadTimeoutMiddleware:
         self._timeout = getattr(spider, 'download_timeout', self._timeout)
 
     def process_request(self, request, spider):
-        if self._timeout:
-            request.meta.setdefault('download_timeout', self._timeout)
+        timeout = self._timeout
+        if timeout:
+            meta = request.meta
+            if 'download_timeout' not in meta:
+                meta['download_timeout'] = timeout
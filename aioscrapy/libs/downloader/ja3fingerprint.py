@@ -14,8 +14,12 @@ class TLSCiphersMiddleware:
     def __init__(self, ciphers, is_random):
         if ciphers == 'DEFAULT':
             self.ciphers = None
+        else:
+            self.ciphers = ciphers
 
         self.is_random = is_random
+        # split once, each request only draws a permutation of it
+        self._cipher_list = (self.ciphers or ORIGIN_CIPHERS).split(":") if is_random else None
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -28,9 +32,8 @@ class TLSCiphersMiddleware:
         if not (self.ciphers or self.is_random):
             return
 
-        ciphers = self.ciphers or ORIGIN_CIPHERS
         if self.is_random:
-            ciphers = ciphers.split(":")
-            random.shuffle(ciphers)
-            ciphers = ":".join(ciphers)
+            ciphers = ":".join(random.sample(self._cipher_list, len(self._cipher_list)))
+        else:
+            ciphers = self.ciphers
         request.meta['TLS_CIPHERS'] = ciphers
@@ -9,6 +9,7 @@ RETRY_HTTP_CODES - which HTTP response codes to retry
 Failed pages are collected on the scraping process and rescheduled at the end,
 once the spider has finished crawling all regular (non failed) pages.
 """
+from functools import lru_cache
 from typing import Optional, Union
 
 from anyio import EndOfStream
@@ -25,6 +26,20 @@ from aioscrapy.utils.log import logger as retry_logger
 from aioscrapy.utils.python import global_object_name
 
 NEED_RETRY_ERROR = (TimeoutError, ConnectionRefusedError, IOError, ProxyException, DownloadError, EndOfStream)
+# isinstance() checks the classes one by one: drop the ones already covered by
+# another entry. ConnectionRefusedError is always an IOError (OSError); asyncio's
+# TimeoutError is the builtin one, an OSError, only from Python 3.11 on, so on
+# 3.9/3.10 it stays in the tuple and timeouts are still retried
+NEED_RETRY_ERROR = tuple(
+    exc for exc in NEED_RETRY_ERROR
+    if not any(exc is not base and issubclass(exc, base) for base in NEED_RETRY_ERROR)
+)
+
+
+@lru_cache(maxsize=256)
+def _retry_stats_keys(stats_base_key, reason):
+    """The count and reason_count stats keys, built once per (base key, reason)"""
+    return f'{stats_base_key}/count', f'{stats_base_key}/reason_count/{reason}'
 
 
 def get_retry_request(
@@ -65,8 +80,9 @@ def get_retry_request(
             priority_adjust = settings.getint('RETRY_PRIORITY_ADJUST')
         new_request.priority = request.priority + priority_adjust
 
-        stats.inc_value(f'{stats_base_key}/count')
-        stats.inc_value(f'{stats_base_key}/reason_count/{reason}')
+        count_key, reason_key = _retry_stats_keys(stats_base_key, str(reason))
+        stats.inc_value(count_key)
+        stats.inc_value(reason_key)
         return new_request
     else:
         stats.inc_value(f'{stats_base_key}/max_reached')
@@ -84,7 +100,7 @@ class RetryMiddleware:
         if not settings.getbool('RETRY_ENABLED'):
             raise NotConfigured
         self.max_retry_times = settings.getint('RETRY_TIMES')
-        self.retry_http_codes = set(int(x) for x in settings.getlist('RETRY_HTTP_CODES'))
+        self.retry_http_codes = frozenset(int(x) for x in settings.getlist('RETRY_HTTP_CODES'))
         self.priority_adjust = settings.getint('RETRY_PRIORITY_ADJUST')
 
     @classmethod
@@ -34,7 +34,7 @@ class AbsQueue(metaclass=ABCMeta):
 
     def _encode_request(self, request: aioscrapy.Request) -> Any:
         """Encode a request object"""
-        obj = request.to_dict(spider=self.spider)
+        obj = request.to_dict(spider=self.spider, shallow=True)
         return self.serializer.dumps(obj)
 
     async def _decode_request(self, encoded_request: Any) -> aioscrapy.Request:
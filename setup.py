@@ -8,7 +8,7 @@ install_requires = [
     "aiohttp",
     "ujson",
     "w3lib>=1.17.0",
-    "parsel>=1.5.0",
+    "parsel>=1.8.0",
     "PyDispatcher>=2.0.5",
     'zope.interface>=5.1.0',
     "redis>=4.3.1",
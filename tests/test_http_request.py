@@ -0,0 +1,70 @@
+from w3lib.url import safe_url_string
+
+from aioscrapy.http import Request
+
+
+def test_url_quoting_matches_w3lib():
+    for url in ("https://a:1/a?)')/", "http://example.com/a'b?c='d'",
+                'http://example.com?a=1', 'http://example.com', 'http://Example.com/a b'):
+        assert Request(url).url == safe_url_string(url, 'utf-8')
+
+
+def test_url_fast_path_unchanged():
+    url = 'https://example.com:8080/a/b;c?d=e&f=(g)*h,i:j@k~l'
+    assert Request(url).url == url
+
+
+def test_set_url_and_body_overrides_are_used():
+    class MyRequest(Request):
+        def _set_url(self, url):
+            super()._set_url(url.replace('http://', 'https://'))
+
+        def _set_body(self, body):
+            super()._set_body(body.upper() if body else body)
+
+    request = MyRequest('http://example.com/', body='abc')
+    assert (request.url, request.body) == ('https://example.com/', 'ABC')
+    request.url = 'http://example.org/'
+    assert request.url == 'https://example.org/'
+    assert MyRequest.bulk_create(['http://example.net/'])[0].url == 'https://example.net/'
+
+
+def test_to_dict_callback_names():
+    from types import MethodType
+
+    class Spider:
+        def parse(self, response):
+            pass
+
+        alias = parse
+
+    def dyn(self, response):
+        pass
+
+    first, second = Spider(), Spider()
+    first.dyn = MethodType(dyn, first)
+    assert Request('http://example.com/', callback=first.parse).to_dict(spider=first)['callback'] == 'alias'
+    assert Request('http://example.com/', callback=first.dyn).to_dict(spider=first)['callback'] == 'dyn'
+    try:
+        Request('http://example.com/', callback=first.dyn).to_dict(spider=second)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a method bound on another spider instance was found')
+
+
+def test_copy():
+    from aioscrapy.http import JsonRequest
+
+    request = JsonRequest('http://example.com/', data={'a': 1}, dumps_kwargs={'sort_keys': True},
+                          meta={'a': 1}, cookies={'b': '2'})
+    copy = request.copy()
+    assert (type(copy), copy.url, copy.body, copy.method) == (JsonRequest, request.url, request.body, 'POST')
+    assert copy.dumps_kwargs == {'sort_keys': True} and copy.dumps_kwargs is not request.dumps_kwargs
+    assert copy.meta == request.meta and copy.meta is not request.meta
+    assert copy.cookies == request.cookies and copy.cookies is not request.cookies
+
+    request = Request('http://example.com/')
+    request.parse_ok = True
+    copy = request.copy()
+    assert copy.url == request.url and not hasattr(copy, 'parse_ok')
@@ -0,0 +1,62 @@
+from aioscrapy.http import HtmlResponse, TextResponse
+
+
+def test_selector_empty_utf8_body():
+    response = HtmlResponse('http://example.com/', body=b'', encoding='utf-8')
+    assert response.xpath('//a') == []
+    assert response.css('a') == []
+
+
+def test_selector_utf8_body():
+    response = HtmlResponse('http://example.com/', body='<a href="/é">é</a>'.encode('utf-8'),
+                            encoding='utf-8')
+    assert response.xpath('//a/text()').get() == 'é'
+    assert response.css('a::attr(href)').get() == '/é'
+
+
+def test_selector_empty_body_headers_encoding():
+    response = TextResponse('http://example.com/', body=b'',
+                            headers={'Content-Type': 'text/html; charset=utf-8'})
+    assert response.xpath('//a') == []
+
+
+def test_json_large_int():
+    body = b'{"id": 18446744073709551616, "neg": -9223372036854775809, "big": 123456789012345678901234567890}'
+    response = TextResponse('http://example.com/', body=body,
+                            headers={'Content-Type': 'application/json'})
+    assert response.json() == {'id': 18446744073709551616, 'neg': -9223372036854775809,
+                               'big': 123456789012345678901234567890}
+
+
+def test_json_utf8_body():
+    response = TextResponse('http://example.com/', body='{"a": "é"}'.encode('utf-8'),
+                            headers={'Content-Type': 'application/json; charset=utf-8'})
+    assert response.json() == {'a': 'é'}
+
+
+def test_url_and_body_validated_on_assignment():
+    response = HtmlResponse('http://example.com/', body=b'<p>x</p>', encoding='utf-8')
+    for attr, value in (('body', '<p>é</p>'), ('url', 123)):
+        try:
+            setattr(response, attr, value)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f'{attr}={value!r} was accepted')
+    assert response.body == b'<p>x</p>'
+    assert response.url == 'http://example.com/'
+
+
+def test_follow_all_uses_overridden_follow():
+    class MyResponse(HtmlResponse):
+        def follow(self, url, *args, **kwargs):
+            request = super().follow(url, *args, **kwargs)
+            request.meta['followed'] = True
+            return request
+
+    body = b'<a href="/a">a</a><a href="http://example.org/b">b</a>'
+    for cls, followed in ((HtmlResponse, False), (MyResponse, True)):
+        response = cls('http://example.com/', body=body, encoding='utf-8')
+        requests = list(response.follow_all(css='a'))
+        assert [r.url for r in requests] == ['http://example.com/a', 'http://example.org/b']
+        assert all(r.meta.get('followed', False) is followed for r in requests)